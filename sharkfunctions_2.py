@@ -1,6 +1,217 @@
+import re
+
 import pandas as pd
 import numpy as np
 
+# Numba is optional: only format_age_numba needs it
+try:
+    from numba import njit
+    from numba.typed import List as _NumbaList
+except ImportError:
+    njit = None
+
+
+# Compiled once at import so str.extract does not recompile the pattern
+# on every call
+_PDF_DATE_RE = re.compile(r'(\d{4}\.\d{2}\.\d{2})')
+
+# Lookup tables are built once at import time so the vectorized cleaners can
+# hand them straight to Series.map instead of rebuilding a dict per row
+COUNTRY_CORRECTIONS = {
+    'Usa': 'United States',
+    'Uk': 'United Kingdom',
+    'England': 'United Kingdom',
+    'Ceylon (Sri Lanka)': 'Sri Lanka',
+    'Trinidad & Tobago': 'Trinidad and Tobago',
+    'Trinidad': 'Trinidad and Tobago',
+    'St. Martin': 'Saint Martin',
+    'St. Maartin': 'Saint Martin',
+    'St Martin': 'Saint Martin',
+    'St Kitts / Nevis': 'Saint Kitts and Nevis',
+    'United Arab Emirates (Uae)': 'United Arab Emirates',
+    'Reunion Island': 'Reunion',
+    'St Helena, British Overseas Territory': 'Saint Helena',
+    'Turks And Caicos': 'Turks and Caicos Islands',
+    'Turks & Caicos': 'Turks and Caicos Islands',
+    'Columbia': 'Colombia',
+    'Papua New Guinea': 'Papua New Guinea',
+    'British Overseas Territory': 'British Overseas Territories',
+    'Palestinian Territories': 'Palestine',
+    'New Caledonia': 'New Caledonia',
+    'Northern Arabian Sea': 'Arabian Sea',
+    'Andaman Islands': 'Andaman and Nicobar Islands',
+    'Equatorial Guinea / Cameroon': 'Equatorial Guinea',
+    'Mediterranean Sea': 'Mediterranean',
+    'Red Sea?': 'Red Sea',
+    'Asia?': 'Asia',
+    'Egypt / Israel': 'Egypt',
+    'Between Portugal & India': 'India',
+    'Africa': 'African continent',
+    'Coast Of Africa': 'African coast',
+    'Tasman Sea': 'Tasman Sea region',
+    'Caribbean Sea': 'Caribbean',
+    'Atlantic Ocean': 'Atlantic',
+    'Okinawa': 'Japan',
+    'Roatan': 'Honduras',
+    'Greenland': 'Denmark',
+    'St Kitts': 'Saint Kitts and Nevis',
+    'St Helena': 'Saint Helena',
+    'Bahrein': 'Bahrain',
+    'Diego Garcia': 'British Indian Ocean Territory',
+    'Guam': 'United States',
+    'Hong Kong': 'China',
+    'Korea': 'South Korea'
+}
+
+# Same table keyed by lowercased/stripped form, so the lookup no longer
+# depends on the input having been title-cased first
+LOWER_CORRECTIONS = {k.lower().strip(): v for k, v in COUNTRY_CORRECTIONS.items()}
+
+NON_COUNTRIES = {
+    'Tasman Sea region', 'Mediterranean', 'Indian Ocean?', 'Atlantic Ocean',
+    'Coral Sea', 'Tasman Sea', 'Mediterranean Sea', 'Caribbean Sea',
+    'Pacific Ocean', 'Indian Ocean', 'Red Sea', 'Gulf of Aden',
+    'Northern Arabian Sea', 'Asia', 'African continent', 'African coast'
+}
+
+ACTIVITY_CORRECTIONS = {
+    'scubadiving': 'scuba diving',
+    'bodyboarding': 'body boarding',
+    'bodysurfing': 'body surfing',
+    'boogieboarding': 'boogie boarding',
+    'freediving': 'free diving',
+    'stand-uppaddleboarding': 'stand-up paddleboarding',
+    'kayakfishing': 'kayak fishing',
+    'fishingforsharks': 'shark fishing',
+    'surfing': 'surfing',
+    'swimming': 'swimming',
+    'fishing': 'fishing',
+    'spearfishing': 'spearfishing',
+    'wading': 'wading',
+    'bathing': 'bathing',
+    'diving': 'diving',
+    'snorkeling': 'snorkeling',
+    'standing': 'standing',
+    'treadingwater': 'treading water',
+    'felloverboard': 'fell overboard',
+    'pearldiving': 'pearl diving',
+    'windsurfing': 'windsurfing',
+    'walking': 'walking',
+    'canoeing': 'canoeing',
+    'floating': 'floating',
+    'sharkfishing': 'shark fishing',
+    'surffishing': 'surf fishing',
+    'playing': 'playing',
+    'surf-skiing': 'surf skiing',
+    'rowing': 'rowing',
+    'paddleboarding': 'paddle boarding',
+    'sponge diving': 'sponge diving',
+    'divingfortrochus': 'diving for trochus',
+    'surfskiiing': 'surf skiing',
+    'seadisaster': 'sea disaster',
+    'skindiving': 'free diving',
+}
+
+
+# Low-cardinality output columns worth storing as category dtype
+# (int8/int16 codes instead of one PyObject pointer per row)
+CATEGORICAL_COLS = ['fatal', 'age_group', 'activity', 'country', 'sex', 'month']
+
+# Known raw columns by kind, used to pin dtypes once at the ingestion
+# boundary so the cleaners can assume string-or-NaN / number-or-NaN
+STRING_INPUT_COLS = ['date', 'type', 'country', 'area', 'location', 'activity',
+                     'name', 'sex', 'age', 'injury', 'is_fatal', 'pdf']
+NUMERIC_INPUT_COLS = ['year']
+
+
+def coerce_input_dtypes_f(df):
+    """
+    Pins each known raw column to a single dtype right after load.
+
+    String columns become string[pyarrow] and numeric columns become
+    nullable Int64, so every row holds either a value of that type or NaN.
+    The cleaners can then skip per-element isinstance checks and dispatch
+    straight to the vectorized kernels.
+
+    Parameters:
+    df (pd.DataFrame): The freshly loaded DataFrame.
+
+    Returns:
+    pd.DataFrame: The DataFrame with coerced dtypes.
+    """
+    str_cols = [col for col in STRING_INPUT_COLS if col in df.columns]
+    df[str_cols] = df[str_cols].astype('string[pyarrow]')
+
+    for col in NUMERIC_INPUT_COLS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
+    return df
+
+
+def convert_strings_to_arrow_f(df):
+    """
+    Converts all object-dtype string columns to the pyarrow string dtype.
+
+    Arrow strings live in one contiguous UTF-8 buffer instead of one Python
+    object per row, so the .str cleaners in this module run in Arrow's C++
+    kernels and the columns take roughly half the memory. Call once right
+    after loading the raw file.
+
+    Parameters:
+    df (pd.DataFrame): The freshly loaded DataFrame.
+
+    Returns:
+    pd.DataFrame: The DataFrame with string columns as string[pyarrow].
+    """
+    str_cols = df.select_dtypes('object').columns
+    df[str_cols] = df[str_cols].astype('string[pyarrow]')
+    return df
+
+
+def categorize_columns_f(df, columns=None):
+    """
+    Converts low-cardinality columns to the memory-efficient category dtype.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame with cleaned columns.
+    columns (list): The columns to convert (default is CATEGORICAL_COLS).
+
+    Returns:
+    pd.DataFrame: The DataFrame with the listed columns as category dtype.
+    """
+    if columns is None:
+        columns = CATEGORICAL_COLS
+
+    # Only touch columns that actually exist on this frame
+    present = [col for col in columns if col in df.columns]
+    df[present] = df[present].astype('category')
+    return df
+
+
+def pack_numeric_block_f(df, columns=None):
+    """
+    Repacks the cleaned numeric columns into one column-major block.
+
+    Collects the numeric columns into a single F-contiguous float64 array,
+    so each column's values sit next to each other in memory and downstream
+    column-wise scans (groupby, aggregation) get sequential prefetch
+    instead of strided access. Call after all cleaners have run.
+
+    Parameters:
+    df (pd.DataFrame): The cleaned DataFrame.
+    columns (list): The numeric columns to pack (default: year, month, age).
+
+    Returns:
+    pd.DataFrame: The DataFrame with the numeric columns in one F-order block.
+    """
+    if columns is None:
+        columns = [col for col in ('year', 'month', 'age') if col in df.columns]
+
+    values = np.asfortranarray(df[columns].to_numpy(dtype='float64',
+                                                    na_value=np.nan))
+    numeric = pd.DataFrame(values, index=df.index, columns=columns, copy=False)
+    return pd.concat([df.drop(columns=columns), numeric], axis=1)
+
 
 def clean_year_column_f(df, column_name, valid_start_year=1900):
     """
@@ -14,19 +225,14 @@ def clean_year_column_f(df, column_name, valid_start_year=1900):
     Returns:
     pd.DataFrame: A DataFrame with the cleaned year column.
     """
-    # step 1:Replace 0.0 with NaN to handle them later
-    df[column_name] = df[column_name].replace(0.0, np.nan)
-
-    # step 2 :Drop rows with NaN values in the specified year column
-    df = df.dropna(subset=[column_name])
+    # Fuse the 0.0/NaN/invalid-year checks into one boolean mask on the raw
+    # array, so the frame is sliced and copied once instead of three times
+    yrs = pd.to_numeric(df[column_name], errors='coerce').to_numpy(dtype='float64')
+    keep = np.isfinite(yrs) & (yrs != 0.0) & (yrs >= valid_start_year)
 
-    # step 3 Convert the year column to integer type
-    df[column_name] = df[column_name].astype(int)
-
-    # step 4:Remove or filter invalid years
-    df = df[df[column_name] >= valid_start_year]
-
-    return df
+    out = df.iloc[keep].copy()
+    out[column_name] = yrs[keep].astype(np.int32)
+    return out
 
 
 def extract_month_f(df, pdf_column='pdf'):
@@ -44,22 +250,17 @@ def extract_month_f(df, pdf_column='pdf'):
     # Convert the specified column to string type
     df[pdf_column] = df[pdf_column].astype(str)
 
-    # Extract the date2 part from the specified column
-    df['date2'] = df[pdf_column].str.extract(r'(\d{4}\.\d{2}\.\d{2})')
-
-    # Convert the extracted date2 string to a datetime object
-    df['date2'] = pd.to_datetime(df['date2'], format='%Y.%m.%d', errors='coerce')
-
-    # Extract the month from the datetime object
-    df['month'] = df['date2'].dt.month
+    # Extract the date part and parse it in a single pipeline, with no
+    # intermediate date column materialized on the frame
+    df['month'] = pd.to_datetime(
+        df[pdf_column].str.extract(_PDF_DATE_RE, expand=False),
+        format='%Y.%m.%d', errors='coerce'
+    ).dt.month.astype('Int8')
 
-    # Drop the intermediate 'date2' column
-    df.drop(columns=['date2'], inplace=True)
-
-    # Move the 'month' column to the second position
-    cols = df.columns.tolist()
-    cols.insert(1, cols.pop(cols.index('month')))
-    df = df[cols]
+    # Move the 'month' column to the second position in place, instead of
+    # rebuilding the whole frame through fancy indexing
+    month_series = df.pop('month')
+    df.insert(1, 'month', month_series)
 
     return df
 
@@ -75,8 +276,9 @@ def clean_sex_column_f(df, column_name='sex'):
     Returns:
     pd.DataFrame: The modified DataFrame with the cleaned column.
     """
-    df[column_name] = df[column_name].apply(lambda x: x.lower() if isinstance(x, str) else x)
-    df[column_name] = df[column_name].apply(lambda x: x.replace(" ", "") if isinstance(x, str) else x)
+    # Vectorized .str ops run in C and leave non-string NaNs untouched,
+    # so no per-row isinstance check is needed
+    df[column_name] = df[column_name].str.lower().str.replace(" ", "", regex=False)
     return df
 
 def extract_month_from_date_f(df, date_column='date', month_column='month'):
@@ -92,86 +294,76 @@ def extract_month_from_date_f(df, date_column='date', month_column='month'):
     Returns:
     pd.DataFrame: The modified DataFrame with the updated month column.
     """
-    # Create a mapping from month abbreviation to month number
-    month_mapping = {
-        'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-        'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-    }
-    
     # Extract the month part from the date column where the month column is NaN
     mask = df[month_column].isna()
-    
+
     # Extract the month abbreviation using slicing
     extracted_month_abbr = df.loc[mask, date_column].str[-8:-5]
-    
-    # Map the extracted month abbreviation to the corresponding month number
-    df.loc[mask, month_column] = extracted_month_abbr.map(month_mapping)
-    
-    # Ensure the month column contains numeric values
-    df[month_column] = pd.to_numeric(df[month_column], errors='coerce')
+
+    # Encode the abbreviations as a Categorical with the months in calendar
+    # order: code + 1 is then the month number, computed in one C pass
+    # instead of a dict lookup per row (unknown abbreviations get code -1)
+    cat = pd.Categorical(extracted_month_abbr,
+                         categories=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                                     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+    df.loc[mask, month_column] = np.where(cat.codes >= 0, cat.codes + 1, np.nan)
+
+    # Ensure the month column is numeric, stored as nullable Int8: a value
+    # in [1..12] does not need 8 bytes per row
+    df[month_column] = pd.to_numeric(df[month_column],
+                                     errors='coerce').astype('Int8')
 
     return df
 
-    
-def normalize_case_f(country):
-    if pd.isna(country):
-        return country
-    return country.title()
+
+def normalize_case_series(countries):
+    """
+    Title-cases a country column on a whole Series at once.
+
+    Parameters:
+    countries (pd.Series): The Series of country names.
+
+    Returns:
+    pd.Series: The Series title-cased, NaN left untouched.
+    """
+    # .str.title handles NaN natively, no per-row pd.isna check needed
+    return countries.str.title()
 
 def standardize_names_f(country):
-    corrections = {
-        'Usa': 'United States',
-        'Uk': 'United Kingdom',
-        'England': 'United Kingdom',
-        'Ceylon (Sri Lanka)': 'Sri Lanka',
-        'Trinidad & Tobago': 'Trinidad and Tobago',
-        'Trinidad': 'Trinidad and Tobago',
-        'St. Martin': 'Saint Martin',
-        'St. Maartin': 'Saint Martin',
-        'St Martin': 'Saint Martin',
-        'St Kitts / Nevis': 'Saint Kitts and Nevis',
-        'United Arab Emirates (Uae)': 'United Arab Emirates',
-        'Reunion Island': 'Reunion',
-        'St Helena, British Overseas Territory': 'Saint Helena',
-        'Turks And Caicos': 'Turks and Caicos Islands',
-        'Turks & Caicos': 'Turks and Caicos Islands',
-        'Columbia': 'Colombia',
-        'Papua New Guinea': 'Papua New Guinea',
-        'British Overseas Territory': 'British Overseas Territories',
-        'Palestinian Territories': 'Palestine',
-        'New Caledonia': 'New Caledonia',
-        'Northern Arabian Sea': 'Arabian Sea',
-        'Andaman Islands': 'Andaman and Nicobar Islands',
-        'Equatorial Guinea / Cameroon': 'Equatorial Guinea',
-        'Mediterranean Sea': 'Mediterranean',
-        'Red Sea?': 'Red Sea',
-        'Asia?': 'Asia',
-        'Egypt / Israel': 'Egypt',
-        'Between Portugal & India': 'India',
-        'Africa': 'African continent',
-        'Coast Of Africa': 'African coast',
-        'Tasman Sea': 'Tasman Sea region',
-        'Caribbean Sea': 'Caribbean',
-        'Atlantic Ocean': 'Atlantic',
-        'Okinawa': 'Japan',
-        'Roatan': 'Honduras',
-        'Greenland': 'Denmark',
-        'St Kitts': 'Saint Kitts and Nevis',
-        'St Helena': 'Saint Helena',
-        'Bahrein': 'Bahrain',
-        'Diego Garcia': 'British Indian Ocean Territory',
-        'Guam': 'United States',
-        'Hong Kong': 'China',
-        'Korea': 'South Korea'
-    }
-    return corrections.get(country, country)
+    return COUNTRY_CORRECTIONS.get(country, country)
+
+def standardize_names_series(countries):
+    """
+    Standardizes country names on a whole Series at once.
+
+    Parameters:
+    countries (pd.Series): The Series of country names.
+
+    Returns:
+    pd.Series: The Series with known variants replaced by their standard name.
+    """
+    # Look up on the lowercased/stripped form so this works on raw input in
+    # any casing; unmatched names fall back to their title-cased form
+    key = countries.str.lower().str.strip()
+    return key.map(LOWER_CORRECTIONS).fillna(countries.str.title())
 
 def filter_non_countries_f(country):
-    non_countries = {'Tasman Sea region','Mediterranean','Indian Ocean?','Atlantic Ocean', 'Coral Sea', 'Tasman Sea', 'Mediterranean Sea', 'Caribbean Sea', 'Pacific Ocean', 'Indian Ocean', 'Red Sea', 'Gulf of Aden', 'Northern Arabian Sea', 'Asia', 'African continent', 'African coast'}
-    if country in non_countries:
+    if country in NON_COUNTRIES:
         return np.nan
     return country
 
+def filter_non_countries_series(countries):
+    """
+    Replaces ocean/sea/region names with NaN on a whole Series at once.
+
+    Parameters:
+    countries (pd.Series): The Series of country names.
+
+    Returns:
+    pd.Series: The Series with non-country entries set to NaN.
+    """
+    return countries.mask(countries.isin(NON_COUNTRIES))
+
 
 def normalize_activity_f(activity):
     if pd.isna(activity):
@@ -179,49 +371,137 @@ def normalize_activity_f(activity):
       
     normalized = activity.lower().replace(' ', '')
 
-    activity_corrections = {
-        'scubadiving': 'scuba diving',
-        'bodyboarding': 'body boarding',
-        'bodysurfing': 'body surfing',
-        'boogieboarding': 'boogie boarding',
-        'freediving': 'free diving',
-        'stand-uppaddleboarding': 'stand-up paddleboarding',
-        'kayakfishing': 'kayak fishing',
-        'fishingforsharks': 'shark fishing',
-        'surfing': 'surfing',
-        'swimming': 'swimming',
-        'fishing': 'fishing',
-        'spearfishing': 'spearfishing',
-        'wading': 'wading',
-        'bathing': 'bathing',
-        'diving': 'diving',
-        'snorkeling': 'snorkeling',
-        'standing': 'standing',
-        'treadingwater': 'treading water',
-        'felloverboard': 'fell overboard',
-        'pearldiving': 'pearl diving',
-        'windsurfing': 'windsurfing',
-        'walking': 'walking',
-        'canoeing': 'canoeing',
-        'floating': 'floating',
-        'sharkfishing': 'shark fishing',
-        'surffishing': 'surf fishing',
-        'playing': 'playing',
-        'surf-skiing': 'surf skiing',
-        'rowing': 'rowing',
-        'surf-skiing': 'surf skiing',
-        'paddleboarding': 'paddle boarding',
-        'sponge diving': 'sponge diving',
-        'divingfortrochus': 'diving for trochus',
-        'surfskiiing': 'surf skiing',
-        'seadisaster': 'sea disaster',
-        'skindiving': 'free diving',
-     }
-    
-    return activity_corrections.get(normalized, normalized)
+    return ACTIVITY_CORRECTIONS.get(normalized, normalized)
+
+def normalize_activity_series(activities):
+    """
+    Normalizes activity names on a whole Series at once.
+
+    Parameters:
+    activities (pd.Series): The Series of activity descriptions.
+
+    Returns:
+    pd.Series: The Series with activities lowercased, despaced and corrected.
+    """
+    normalized = activities.str.lower().str.replace(' ', '', regex=False)
+    return normalized.map(ACTIVITY_CORRECTIONS).fillna(normalized)
+
+def normalize_activity_factorized(activities):
+    """
+    Normalizes activity names by deduplicating the column first.
+
+    Shark datasets have only ~100 unique activities across thousands of
+    rows, so the cleaning work is done once per unique value and the
+    results gathered back by integer codes.
+
+    Parameters:
+    activities (pd.Series): The Series of activity descriptions.
+
+    Returns:
+    pd.Series: The Series with activities lowercased, despaced and corrected.
+    """
+    codes, uniques = pd.factorize(activities)
+    cleaned_uniques = np.array([normalize_activity_f(u) for u in uniques],
+                               dtype=object)
+    # NaN rows get code -1, which indexes the appended NaN slot
+    cleaned_uniques = np.append(cleaned_uniques, np.nan)
+    return pd.Series(cleaned_uniques[codes], index=activities.index)
 
 
-def format_age_f (age) : 
+def format_age_series(s):
+    """
+    Parses a raw age column to nullable integers on a whole Series.
+
+    Parameters:
+    s (pd.Series): The raw ages ("25", "20s", "25 or 28", "7½", ...).
+
+    Returns:
+    pd.Series: The ages as nullable Int64, NaN where no age can be read.
+    """
+    t = s.astype('string').str.strip().str.lower()
+
+    # Unparseable forms: "a minor", anything with '?', and ranges that mix
+    # ',' and '&'
+    bad = (t.str.contains('a min|\\?', regex=True, na=False)
+           | (t.str.contains(',', regex=False, na=False)
+              & t.str.contains('&', regex=False, na=False)))
+    t = t.mask(bad)
+
+    # The leading integer covers "25", "25 & 28", "25 or 28", "25 to 28",
+    # "20s", "20's" and "7½" in a single regex scan
+    return pd.to_numeric(t.str.extract(r'^(\d+)', expand=False),
+                         errors='coerce').astype('Int64')
+
+def clean_row_level_f(df):
+    """
+    Cleans the sex, activity and age columns in one sweep over the frame.
+
+    Equivalent to calling clean_sex_column_f, normalize_activity_series and
+    format_age_series separately, but all three output columns land on the
+    frame through a single assign instead of three.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame with raw sex, activity and age columns.
+
+    Returns:
+    pd.DataFrame: A new DataFrame with the three columns cleaned.
+    """
+    sex = df['sex'].str.lower().str.replace(' ', '', regex=False)
+    activity = normalize_activity_series(df['activity'])
+    age = format_age_series(df['age'])
+    return df.assign(sex=sex, activity=activity, age=age)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _format_age_kernel(ages):
+        # Same branches as format_age_series, but compiled: skip the known
+        # bad forms, then parse the leading digits by hand (numba has no
+        # int(str) for arbitrary input)
+        out = np.full(len(ages), np.nan)
+        for i in range(len(ages)):
+            a = ages[i].strip().lower()
+            if 'a min' in a or '?' in a or (',' in a and '&' in a):
+                continue
+            value = 0
+            ndigits = 0
+            for ch in a:
+                if '0' <= ch <= '9':
+                    value = value * 10 + (ord(ch) - 48)
+                    ndigits += 1
+                else:
+                    break
+            if ndigits > 0:
+                out[i] = value
+        return out
+
+
+def format_age_numba(s):
+    """
+    Numba-compiled fallback for format_age_series.
+
+    Runs the same parse as format_age_series but as a compiled loop over
+    the strings, for cases where the regex pipeline is not available or a
+    corner case needs per-row branching in native code.
+
+    Parameters:
+    s (pd.Series): The raw ages.
+
+    Returns:
+    pd.Series: The ages as nullable Int64, NaN where no age can be read.
+    """
+    if njit is None:
+        raise ImportError("format_age_numba requires the optional numba package")
+
+    # Numba cannot introspect a pandas Series, so hand it a typed list of
+    # plain strings (NaN becomes '', which parses to no digits)
+    ages = _NumbaList(s.fillna('').astype(str).tolist())
+    return pd.Series(_format_age_kernel(ages), index=s.index).astype('Int64')
+
+
+def format_age_f (age) :
+    # Deprecated scalar version, kept for notebooks that still apply it
+    # row by row; prefer format_age_series on whole columns.
     if isinstance (age,str) :
         age = age.strip().lower()
         if 'a min' in age :
@@ -254,19 +534,91 @@ def format_age_f (age) :
 
 
 def fatal_f (x):
+    # Deprecated scalar version, kept for notebooks that still apply it
+    # row by row; prefer fatal_series on whole columns.
     if pd.isna(x):
         return 'UNKNOWN'
-    if isinstance(x, int):           
-        return 'UNKNOWN'  
+    if isinstance(x, int):
+        return 'UNKNOWN'
     x = str(x.strip().lower())
-    if x == 'y' or x == 'f':           
-        return 'Yes'     
+    if x == 'y' or x == 'f':
+        return 'Yes'
     elif x == 'n':
         return 'No'
     else:
         return 'UNKNOWN'
 
+def fatal_series(s):
+    """
+    Maps a fatal flag column to 'Yes' / 'No' / 'UNKNOWN' on a whole Series.
+
+    Parameters:
+    s (pd.Series): The raw fatal column (mixed 'Y'/'N'/'F' strings, ints, NaN).
+
+    Returns:
+    pd.Series: The cleaned column with values 'Yes', 'No' or 'UNKNOWN'.
+    """
+    # Stray integers mean "unknown", same as in the scalar version
+    is_int = s.map(type).eq(int)
+    norm = s.where(~is_int).astype('string').str.strip().str.lower()
+
+    # The if/elif chain becomes three boolean masks evaluated in C
+    conds = [
+        (s.isna() | is_int).to_numpy(),
+        norm.isin(['y', 'f']).fillna(False).to_numpy(),
+        norm.eq('n').fillna(False).to_numpy(),
+    ]
+    choices = ['UNKNOWN', 'Yes', 'No']
+    return pd.Series(np.select(conds, choices, default='UNKNOWN'), index=s.index)
+
+def quarter_from_month(months):
+    """
+    Derives the calendar quarter from a month column on a whole Series.
+
+    Parameters:
+    months (pd.Series): The month numbers (1-12), possibly with NaN.
+
+    Returns:
+    pd.Series: The quarter (1-4) as Int8, with -1 for missing/invalid months.
+    """
+    m = pd.to_numeric(months, errors='coerce').to_numpy(dtype='float64',
+                                                        na_value=np.nan)
+    # Single np.where pass; -1 is the sentinel for missing months
+    q = np.where(np.isfinite(m) & (m > 0), (m - 1) // 3 + 1, -1)
+    return pd.Series(q, index=months.index).astype('Int8')
+
+def is_fatal_bool(fatal):
+    """
+    Derives a boolean is_fatal column from a cleaned fatal column.
+
+    Parameters:
+    fatal (pd.Series): The fatal column ('Yes'/'No'/'UNKNOWN').
+
+    Returns:
+    pd.Series: True where the attack was fatal.
+    """
+    return fatal.eq('Yes')
+
+def age_group_series(ages):
+    """
+    Bins an age column into the standard age groups on a whole Series.
+
+    Parameters:
+    ages (pd.Series): The ages (numeric or numeric-like strings).
+
+    Returns:
+    pd.Series: The age group labels, with 'unknown' for missing ages.
+    """
+    # pd.cut bins the whole column in one Cython pass instead of an
+    # if/elif chain per row
+    groups = pd.cut(pd.to_numeric(ages, errors='coerce'),
+                    bins=[-np.inf, 12, 17, 29, 49, np.inf],
+                    labels=['kids', 'teen', 'young adult', 'adult', 'senior'])
+    return groups.astype(object).fillna('unknown')
+
 def age_group_f(age):
+    # Deprecated scalar version, kept for notebooks that still apply it
+    # row by row; prefer age_group_series on whole columns.
     if age < 13:
         return 'kids'
     elif 13 <= age <= 17: